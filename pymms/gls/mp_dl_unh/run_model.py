@@ -123,7 +123,7 @@ def chunk_process(start_date, end_date, spacecraft, gpu, chunks, delete_after_ch
             temp_path = os.path.join(tempfile.gettempdir(), file_name)
             selections.to_csv(temp_path, index=False)
             selections = sel.read_csv(temp_path)
-            sel.combine_segments(selections, 5)
+            selections = sel.combine_segments(selections, 5)
             sel.write_csv(dropbox_dir + file_name, selections)
 
         if delete_after_chunk:
@@ -230,7 +230,7 @@ def main():
             temp_path = os.path.join(tempfile.gettempdir(), file_name)
             selections.to_csv(temp_path, index=False)
             selections = sel.read_csv(temp_path)
-            sel.combine_segments(selections, 5)
+            selections = sel.combine_segments(selections, 5)
             sel.write_csv(dropbox_dir + file_name, selections)
 
     print(f"Done | {datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S')}")
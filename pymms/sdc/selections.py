@@ -1,7 +1,11 @@
 import pathlib
 import re
 import csv
+import bisect
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+import numpy as np
 from . import mrmms_sdc_api as sdc
 from cdflib import cdfread, epochs
 import matplotlib.pyplot as plt
@@ -9,9 +13,89 @@ from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 
 tai_1958 = epochs.CDFepoch.compute_tt2000([1958, 1, 1, 0, 0, 0, 0, 0, 0])
 
+# TAI epoch and the cumulative TAI-UTC leap second offsets since 1972
+# (source: ftp://maia.usno.navy.mil/ser7/tai-utc.dat). With these,
+# converting a UTC datetime to TAI seconds reduces to one subtraction
+# and a table lookup instead of a call into cdflib.
+_tai_epoch = dt.datetime(1958, 1, 1)
+_leap_dates = [dt.datetime(year, month, 1)
+               for year, month in ((1972, 1), (1972, 7), (1973, 1),
+                                   (1974, 1), (1975, 1), (1976, 1),
+                                   (1977, 1), (1978, 1), (1979, 1),
+                                   (1980, 1), (1981, 7), (1982, 7),
+                                   (1983, 7), (1985, 7), (1988, 1),
+                                   (1990, 1), (1991, 1), (1992, 7),
+                                   (1993, 7), (1994, 7), (1996, 1),
+                                   (1997, 7), (1999, 1), (2006, 1),
+                                   (2009, 1), (2012, 7), (2015, 7),
+                                   (2017, 1))
+               ]
+_leap_seconds = list(range(10, 10 + len(_leap_dates)))
+_leap_dates64 = np.array(_leap_dates, dtype='datetime64[s]')
+_leap_seconds64 = np.array(_leap_seconds, dtype=np.int64)
+
+# The same leap-second boundaries expressed in TAI seconds since the
+# epoch, for the reverse (TAI to UTC) lookup
+_leap_tai = [int((date - _tai_epoch).total_seconds()) + seconds
+             for date, seconds in zip(_leap_dates, _leap_seconds)]
+_leap_tai64 = np.array(_leap_tai, dtype=np.int64)
+
+# Shared instance for the cdflib validation paths; instantiating a
+# CDFepoch per call is pure overhead
+_cdfepoch = epochs.CDFepoch()
+
+
+def _datetime64_to_tai(times):
+    '''
+    Convert an array of times to TAI seconds since 1958-01-01.
+
+    Parameters
+    ----------
+    times : `numpy.ndarray` of datetime64
+        UTC times to be converted
+
+    Returns
+    -------
+    tai : `numpy.ndarray` of int64
+        TAI seconds since the 1958 epoch
+    '''
+    times = np.asarray(times, dtype='datetime64[s]')
+    ileap = np.searchsorted(_leap_dates64, times, side='right') - 1
+    return ((times - np.datetime64('1958-01-01', 's')).astype(np.int64)
+            + _leap_seconds64[ileap]
+            )
+
+
+def _tai_to_datetime64(tai):
+    '''
+    Convert an array of TAI seconds since 1958-01-01 to times.
+
+    Parameters
+    ----------
+    tai : `numpy.ndarray` of int64
+        TAI seconds since the 1958 epoch
+
+    Returns
+    -------
+    times : `numpy.ndarray` of datetime64[s]
+        The equivalent UTC times
+    '''
+    tai = np.asarray(tai, dtype=np.int64)
+    ileap = np.searchsorted(_leap_tai64, tai, side='right') - 1
+    return (np.datetime64('1958-01-01', 's')
+            + (tai - _leap_seconds64[ileap]).astype('timedelta64[s]')
+            )
+
+# Numba is optional. When it is installed the duplicate-removal kernel
+# below is JIT compiled; otherwise it runs as plain Python.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 class BurstSegment:
     def __init__(self, tstart, tstop, fom, discussion,
-                 sourceid=None, createtime=None):
+                 sourceid=None, createtime=None, file=None):
         '''
         Create an object representing a burst data segment.
 
@@ -47,10 +131,12 @@ class BurstSegment:
 
         self.discussion = discussion
         self.createtime = createtime
+        self.file = file
         self.fom = fom
         self.sourceid = sourceid
         self.tstart = tstart
         self.tstop = tstop
+        self._file_start_time = None
 
     def __str__(self):
         return ('{0}   {1}   {2:3.0f}   {3}'
@@ -62,6 +148,26 @@ class BurstSegment:
                 .format(self.tstart, self.tstop, self.fom, self.discussion)
                 )
 
+    def file_start_time(self):
+        '''
+        Time stamp in the name of the file containing the selection.
+
+        Selection file names end in 'YYYY-MM-DD-hh-mm-ss'. The name
+        never changes, so the time stamp is parsed once and cached.
+
+        Returns
+        -------
+        file_start_time : `datetime.datetime`
+            Time stamp of the selection file, or `None` if the
+            segment is not associated with a file
+        '''
+        if (self._file_start_time is None) and (self.file is not None):
+            self._file_start_time = dt.datetime.strptime(
+                pathlib.Path(self.file).stem.split('_')[-1],
+                '%Y-%m-%d-%H-%M-%S'
+                )
+        return self._file_start_time
+
     @staticmethod
     def datetime_to_list(t):
         return [t.year, t.month, t.day,
@@ -70,14 +176,24 @@ class BurstSegment:
                 ]
 
     @classmethod
-    def datetime_to_tai(cls, t):
-        t_list = cls.datetime_to_list(t)
-        return int((epochs.CDFepoch.compute_tt2000(t_list) - tai_1958) // 1e9)
+    def datetime_to_tai(cls, t, use_cdflib=False):
+        # The general-purpose cdflib conversion is ~100x slower than
+        # direct arithmetic; it is kept only for validation
+        if use_cdflib:
+            t_list = cls.datetime_to_list(t)
+            return int((epochs.CDFepoch.compute_tt2000(t_list) - tai_1958)
+                       // 1e9)
+
+        ileap = bisect.bisect_right(_leap_dates, t) - 1
+        return int((t - _tai_epoch).total_seconds()) + _leap_seconds[ileap]
 
     @classmethod
-    def tai_to_datetime(cls, t):
-        tepoch  = epochs.CDFepoch()
-        return tepoch.to_datetime(t * int(1e9) + tai_1958)
+    def tai_to_datetime(cls, t, use_cdflib=False):
+        if use_cdflib:
+            return _cdfepoch.to_datetime(t * int(1e9) + tai_1958)
+
+        ileap = bisect.bisect_right(_leap_tai, t) - 1
+        return _tai_epoch + dt.timedelta(seconds=t - _leap_seconds[ileap])
 
     @property
     def start_time(self):
@@ -87,13 +203,174 @@ class BurstSegment:
     def stop_time(self):
         return self.tstop.strftime('%Y-%m-%d %H:%M:%S')
 
+    @property
+    def tstart(self):
+        return self._tstart
+
+    @tstart.setter
+    def tstart(self, value):
+        # Invalidate the cached TAI time when the segment interval changes
+        self._tstart = value
+        self._tai_start = None
+
+    @property
+    def tstop(self):
+        return self._tstop
+
+    @tstop.setter
+    def tstop(self, value):
+        self._tstop = value
+        self._tai_stop = None
+
     @property
     def taistarttime(self):
-        return self.__class__.datetime_to_tai(self.tstart)
+        # Converting to TAI is expensive, so cache the result
+        if self._tai_start is None:
+            self._tai_start = self.__class__.datetime_to_tai(self.tstart)
+        return self._tai_start
 
     @property
     def taiendtime(self):
-        return self.__class__.datetime_to_tai(self.tstop)
+        if self._tai_stop is None:
+            self._tai_stop = self.__class__.datetime_to_tai(self.tstop)
+        return self._tai_stop
+
+
+class SegmentTable:
+    '''
+    A columnar (structure-of-arrays) view of burst segments.
+
+    Each attribute of `BurstSegment` is stored as a parallel
+    `numpy.ndarray` so that bulk operations (sorting, combining,
+    overlap statistics) run as array expressions instead of
+    per-object attribute lookups.
+
+    Parameters
+    ----------
+    tstart, tstop : `numpy.ndarray` of datetime64[us]
+        Start and stop times of the burst segments
+    fom : `numpy.ndarray` of float64
+        Figure of merit given to each selection
+    discussion : `numpy.ndarray` of object
+        Description of each segment provided by the SITL
+    sourceid : `numpy.ndarray` of object
+        Username of the SITL that made each selection
+    createtime : `numpy.ndarray` of object
+        Time at which each selection was created
+    '''
+
+    def __init__(self, tstart, tstop, fom, discussion,
+                 sourceid=None, createtime=None):
+        ntimes = len(tstart)
+        if sourceid is None:
+            sourceid = np.full(ntimes, None, dtype=object)
+        if createtime is None:
+            createtime = np.full(ntimes, None, dtype=object)
+
+        self.tstart = np.asarray(tstart, dtype='datetime64[us]')
+        self.tstop = np.asarray(tstop, dtype='datetime64[us]')
+        self.fom = np.asarray(fom, dtype=np.float64)
+        self.discussion = np.asarray(discussion, dtype=object)
+        self.sourceid = np.asarray(sourceid, dtype=object)
+        self.createtime = np.asarray(createtime, dtype=object)
+
+    def __len__(self):
+        return len(self.tstart)
+
+    def __getitem__(self, key):
+        # A scalar index materializes a single segment; anything
+        # else (slice, index array, boolean mask) selects a new table
+        if np.isscalar(key) or isinstance(key, (int, np.integer)):
+            return self._segment(key)
+
+        return self.__class__(self.tstart[key], self.tstop[key],
+                              self.fom[key], self.discussion[key],
+                              sourceid=self.sourceid[key],
+                              createtime=self.createtime[key]
+                              )
+
+    def __iter__(self):
+        return (self._segment(idx) for idx in range(len(self)))
+
+    def _segment(self, idx):
+        return BurstSegment(self.tstart[idx].item(), self.tstop[idx].item(),
+                            self.fom[idx], self.discussion[idx],
+                            sourceid=self.sourceid[idx],
+                            createtime=self.createtime[idx]
+                            )
+
+    @property
+    def taistarttime(self):
+        return _datetime64_to_tai(self.tstart)
+
+    @property
+    def taiendtime(self):
+        return _datetime64_to_tai(self.tstop)
+
+    @classmethod
+    def from_dict(cls, data):
+        '''
+        Build a table from columnar selection data.
+
+        Start and stop times given as strings are parsed in bulk by
+        NumPy's datetime64 parser rather than one `strptime` call
+        per row.
+
+        Parameters
+        ----------
+        data : dict
+            Data associated with each burst segment, as returned by
+            `MrMMS_SDC_API.sitl_selections`. Must have keys 'tstart',
+            'tstop', 'fom', 'discussion', 'sourceid', and 'createtime'.
+
+        Returns
+        -------
+        table : `SegmentTable`
+            The selections in columnar form
+        '''
+        return cls(np.asarray(data['tstart'], dtype='datetime64[us]'),
+                   np.asarray(data['tstop'], dtype='datetime64[us]'),
+                   np.asarray(data['fom'], dtype=np.float64),
+                   np.asarray(data['discussion'], dtype=object),
+                   sourceid=np.asarray(data['sourceid'], dtype=object),
+                   createtime=np.asarray(data['createtime'], dtype=object)
+                   )
+
+    @classmethod
+    def from_segments(cls, data):
+        '''
+        Build a table from a list of `BurstSegment` instances.
+
+        Parameters
+        ----------
+        data : list of `BurstSegment`
+            Burst segments to be tabulated
+
+        Returns
+        -------
+        table : `SegmentTable`
+            The segments in columnar form
+        '''
+        return cls(np.array([s.tstart for s in data], dtype='datetime64[us]'),
+                   np.array([s.tstop for s in data], dtype='datetime64[us]'),
+                   np.array([s.fom for s in data], dtype=np.float64),
+                   np.array([s.discussion for s in data], dtype=object),
+                   sourceid=np.array([s.sourceid for s in data],
+                                     dtype=object),
+                   createtime=np.array([s.createtime for s in data],
+                                       dtype=object)
+                   )
+
+    def to_segments(self):
+        '''
+        Materialize the table as a list of `BurstSegment` instances.
+
+        Returns
+        -------
+        data : list of `BurstSegment`
+            One segment per table row
+        '''
+        return list(self)
 
 
 def _burst_data_segments_to_burst_segment(data):
@@ -190,7 +467,7 @@ def _get_selections(type, start, stop,
 
     # Additional handling of data
     if combine:
-        combine_segments(data, delta_t)
+        data = combine_segments(data, delta_t)
     if sort:
         data = sort_segments(data)
     if unique:
@@ -330,6 +607,16 @@ def _latest_segments(data, orbit_start, orbit_stop, sitl=False):
     results : list of BurstSegments
         The latest burst selections
     '''
+    # Segments are sorted by start time, so each orbit's segments can
+    # be found with a binary search instead of rescanning the whole
+    # list. Stop times are not necessarily monotonic, so the lower
+    # bound uses their running maximum.
+    seg_tstarts = np.array([segment.tstart for segment in data],
+                           dtype='datetime64[us]')
+    seg_tstops_max = np.maximum.accumulate(
+        np.array([segment.tstop for segment in data], dtype='datetime64[us]')
+        )
+
     result = []
     for orbit in range(orbit_start, orbit_stop+1):
         # The start and end times of the sub-regions of interest.
@@ -364,16 +651,19 @@ def _latest_segments(data, orbit_start, orbit_stop, sitl=False):
             sitl_window = sdc.mission_events('sitl_window', orbit, orbit)
 
         # Find the burst segments that were selected within the
-        # current SROI
+        # current SROI. Segments before `lo` stop before the SROI
+        # starts; segments at `hi` and beyond start after it ends.
+        lo = np.searchsorted(seg_tstops_max, np.datetime64(tstart, 'us'),
+                             side='left')
+        hi = np.searchsorted(seg_tstarts, np.datetime64(tend, 'us'),
+                             side='right')
+
         create_time = None
         orbit_segments = []
-        for idx, segment in enumerate(data):
+        for segment in data[lo:hi]:
             # Filter out selections from the previous orbit(s)
-            # Stop when we get to the next orbit
             if segment.tstop < tstart:
                 continue
-            if segment.tstart > tend:
-                break
 
             # Initialize with the first segment within the orbit.
             # Create times are the same for all selections within
@@ -405,9 +695,7 @@ def _latest_segments(data, orbit_start, orbit_stop, sitl=False):
             else:
                 continue
 
-        # Truncate the segments and append this orbit's submissions
-        # to the overall results.
-        data = data[idx:]
+        # Append this orbit's submissions to the overall results.
         result.extend(orbit_segments)
 
     return result
@@ -431,6 +719,171 @@ def _mission_events_to_burst_segment(data):
     raise NotImplementedError
 
 
+def _parse_time_str(time_str):
+    '''
+    Parse a fixed-format time string `'%Y-%m-%d %H:%M:%S'`.
+
+    Slicing a fixed-width string is much faster than
+    `datetime.strptime`, which matters when parsing one
+    time per row of a large CSV file.
+
+    Parameters
+    ----------
+    time_str : str
+        Time formatted as `'%Y-%m-%d %H:%M:%S'`
+
+    Returns
+    -------
+    time : `datetime.datetime`
+        The parsed time
+    '''
+    return dt.datetime(int(time_str[0:4]), int(time_str[5:7]),
+                       int(time_str[8:10]), int(time_str[11:13]),
+                       int(time_str[14:16]), int(time_str[17:19])
+                       )
+
+
+def _dedupe_keep_mask(tai_start, tai_stop, createtime):
+    '''
+    Flag duplicate burst segments for removal.
+
+    Segments overlap if a later segment starts before an earlier
+    segment stops; of each overlapping pair, the one with the earlier
+    create time is dropped. Operates purely on int64 arrays so that
+    Numba can compile it when available.
+
+    Parameters
+    ----------
+    tai_start, tai_stop : `numpy.ndarray` of int64
+        Segment start and stop times in TAI seconds, sorted by start
+        time
+    createtime : `numpy.ndarray` of int64
+        Time at which each segment was created
+
+    Returns
+    -------
+    keep : `numpy.ndarray` of bool
+        True for segments to be kept
+    '''
+    nsegs = len(tai_start)
+    keep = np.ones(nsegs, dtype=np.bool_)
+    for idx in range(nsegs):
+        dt_ref = tai_stop[idx] - tai_start[idx]
+
+        # Segments should already be sorted. Future segments
+        # overlap with the current segment if the future segment
+        # start time is closer to the current segment start
+        # time than is the current segment's end time.
+        iahead = idx + 1
+        while ((iahead < nsegs)
+               and ((tai_start[iahead] - tai_start[idx]) < dt_ref)
+               ):
+            # Remove the segment with the earlier create time
+            if createtime[idx] < createtime[iahead]:
+                keep[idx] = False
+            else:
+                keep[iahead] = False
+            iahead += 1
+
+    return keep
+
+
+if njit is not None:
+    _dedupe_keep_mask = njit(cache=True)(_dedupe_keep_mask)
+
+
+def _selection_overlaps(refs, tests):
+    '''
+    Gather overlap statistics for many reference segments at once.
+
+    Produces the same results as calling `selection_overlap` once per
+    reference segment, but in O((n+m) log m) instead of O(n*m): the
+    test segments are scanned once into sorted TAI arrays and each
+    reference segment finds its overlapping window with a binary
+    search.
+
+    Parameters
+    ----------
+    refs : list of `selections.BurstSegment`
+        The reference burst segments.
+    tests : list of `selections.BurstSegment`
+        The burst segments against which the reference segments are
+        compared.
+
+    Returns
+    -------
+    out : list of dict
+        One dictionary per reference segment, as returned by
+        `selection_overlap`.
+    '''
+    if len(tests) == 0:
+        return [selection_overlap(ref, tests) for ref in refs]
+
+    # Sort the test segments by start time. Stop times are not
+    # necessarily monotonic if test segments overlap each other, so
+    # the window search below uses their running maximum.
+    # Microseconds since the Unix epoch, so that overlap timedeltas
+    # are exact even for sub-second segment bounds.
+    if not isinstance(tests, SegmentTable):
+        tests = SegmentTable.from_segments(tests)
+    test_starts = tests.tstart.astype(np.int64)
+    test_stops = tests.tstop.astype(np.int64)
+    isort = np.argsort(test_starts, kind='stable')
+    test_starts = test_starts[isort]
+    test_stops = test_stops[isort]
+    test_stops_max = np.maximum.accumulate(test_stops)
+
+    out = []
+    for ref in refs:
+        ref_start = np.datetime64(ref.tstart, 'us').astype(np.int64)
+        ref_stop = np.datetime64(ref.tstop, 'us').astype(np.int64)
+
+        result = {'dt': ref.tstop - ref.tstart,
+                  'dt_next': dt.timedelta(days=7000),
+                  'n_selections': 0,
+                  't_overlap': dt.timedelta(seconds=0.0),
+                  't_overselect': dt.timedelta(seconds=0.0),
+                  'pct_overlap': 0.0,
+                  'pct_overselect': 0.0
+                  }
+
+        # Tests before `lo` stop before the reference segment starts;
+        # tests at `hi` and beyond start after it stops. Only the
+        # window in between can overlap.
+        lo = np.searchsorted(test_stops_max, ref_start, side='left')
+        hi = np.searchsorted(test_starts, ref_stop, side='right')
+        if hi > lo:
+            overlaps = (np.minimum(test_stops[lo:hi], ref_stop)
+                        - np.maximum(test_starts[lo:hi], ref_start)
+                        )
+            result['n_selections'] = int(np.count_nonzero(overlaps >= 0))
+            result['t_overlap'] = dt.timedelta(
+                microseconds=int(overlaps[overlaps >= 0].sum())
+                )
+
+        # Time to nearest interval
+        inext = np.searchsorted(test_starts, ref_start)
+        dt_next = min(abs(int(test_starts[i]) - ref_start)
+                      for i in (inext - 1, inext)
+                      if 0 <= i < len(test_starts)
+                      )
+        result['dt_next'] = dt.timedelta(microseconds=int(dt_next))
+
+        # Overlap and over-selection statistics
+        if result['n_selections'] > 0:
+            result['t_overselect'] = result['dt'] - result['t_overlap']
+            result['pct_overlap'] = result['t_overlap'] / result['dt'] * 100.0
+            result['pct_overselect'] = (result['t_overselect'] / result['dt']
+                                        * 100.0)
+        else:
+            result['t_overselect'] = result['dt']
+            result['pct_overselect'] = 100.0
+
+        out.append(result)
+
+    return out
+
+
 def _sitl_selections_to_burst_segment(data):
     '''
     Turn selections created by `MrMMS_SDC_API.sitl_selections` and turn
@@ -446,15 +899,9 @@ def _sitl_selections_to_burst_segment(data):
     result : list of `BurstSegment`
         Data converted to `BurstSegment` instances
     '''
-    result = []
-    for idx in range(len(data['fom'])):
-        result.append(BurstSegment(data['tstart'][idx], data['tstop'][idx],
-                                   data['fom'][idx], data['discussion'][idx],
-                                   sourceid=data['sourceid'][idx],
-                                   createtime=data['createtime'][idx],
-                                   )
-                      )
-    return result
+    # Parse the time columns in bulk, then materialize the segments
+    # from the already-parsed datetimes
+    return SegmentTable.from_dict(data).to_segments()
 
 
 def combine_segments(data, dt_contig=0):
@@ -469,54 +916,46 @@ def combine_segments(data, dt_contig=0):
         Time interval between adjacent selections. For selections
         returned by `pymms.sitl_selections()`, this is 0. For selections
         returned by `pymms.burst_data_segment()`, this is 10.
-    '''
-    # Any time delta > dt_contig sec indicates the end of a contiguous interval
-    t_deltas = [(seg1.tstart - seg0.tstop).astype('timedelta64[s]').astype(float)
-                for seg1, seg0 in zip(data[1:], data[:-1])
-                ]
-    '''
-    t_deltas = [(seg1.tstart - seg0.tstop).total_seconds()
-                for seg1, seg0 in zip(data[1:], data[:-1])
-                ]
-    '''
-    
-    # Time deltas has one fewer element than data at this stage. Append
-    # infinity to the time deltas to indicate that the last element in data
-    # does not have a contiguous neighbor. This will make the number of
-    # elements in each array equal UNLESS data is empty. Do not append if
-    # data is empty (to avoid indexing errors below).
-    if len(data) > 0:
-        t_deltas.append(1000)
-    
-    icontig = 0  # Current contiguous interval
-    result = []
 
-    # Check if adjacent elements are continuous in time
-    #   - Use itertools.islice to select start index without copying array
-    for idx, t_delta in enumerate(t_deltas):
-        # Contiguous segments are separated by dt_contig seconds.
-        # The last element of t_delta = 1000, so not pass this
-        # condition and idx+1 will not cause an IndexError
-        if t_delta == dt_contig:
-            # And unique segments have the same fom and discussion
-            if (data[icontig].fom == data[idx+1].fom) and \
-                    (data[icontig].discussion == data[idx+1].discussion):
-                continue
-
-        # End of a contiguous interval
-        data[icontig].tstop = data[idx].tstop
+    Returns
+    -------
+    result : list of `BurstSegment`
+        The combined selections.
+    '''
+    if len(data) < 2:
+        return list(data)
+
+    # Gather the segment bounds and identifying information into
+    # arrays so that the contiguity tests are single vectorized
+    # expressions instead of per-segment Python comparisons.
+    tstart = np.array([seg.tstart for seg in data], dtype='datetime64[us]')
+    tstop = np.array([seg.tstop for seg in data], dtype='datetime64[us]')
+    fom = np.array([seg.fom for seg in data])
+    discussion = np.array([seg.discussion for seg in data], dtype=object)
+
+    # Any time delta > dt_contig sec indicates the end of a contiguous
+    # interval. Unique segments also have the same fom and discussion.
+    t_deltas = (tstart[1:] - tstop[:-1]) / np.timedelta64(1, 's')
+    contiguous = ((t_deltas == dt_contig)
+                  & (fom[1:] == fom[:-1])
+                  & (discussion[1:] == discussion[:-1])
+                  )
 
-        # Next interval
-        icontig = icontig + 1
+    # Each run of contiguous segments collapses into a single segment
+    # spanning from the start of the run's first segment to the stop
+    # of its last segment.
+    iends = np.append(np.flatnonzero(~contiguous), len(data) - 1)
+    istarts = np.append(0, iends[:-1] + 1)
 
-        # Move data for new contiguous segments to beginning of array
-        try:
-            data[icontig] = data[idx+1]
-        except IndexError:
-            pass
+    # Build the result with a single forward pass rather than
+    # repeatedly shifting the tail of the input list
+    result = []
+    for istart, iend in zip(istarts, iends):
+        segment = data[istart]
+        segment.tstop = data[iend].tstop
+        result.append(segment)
 
-    # Truncate data beyond last contiguous interval
-    del data[icontig:]
+    return result
 
 
 def filter_segments(data, filter, case_sensitive=False):
@@ -536,14 +975,18 @@ def filter_segments(data, filter, case_sensitive=False):
     flags = re.IGNORECASE
     if case_sensitive:
         flags = 0
-    
+
+    # Compile once instead of re-fetching the pattern from the
+    # regex cache for every segment
+    pattern = re.compile(filter, flags)
+
     return [seg
             for seg in data
-            if re.search(filter, seg.discussion, flags)]
+            if pattern.search(seg.discussion)]
 
 
 def plot_metric(ref_data, test_data, fig, labels, location,
-                nbins=10):
+                nbins=10, overlaps=None):
     '''
     Visualize the overlap between segments.
 
@@ -560,6 +1003,9 @@ def plot_metric(ref_data, test_data, fig, labels, location,
         Location of the figure (row, col, nrows, ncols)
     nbins : int
         Number of histogram bins to create
+    overlaps : list of dict
+        Overlap statistics from `_selection_overlaps(ref_data,
+        test_data)`, if they have already been computed
 
     Returns:
     --------
@@ -572,10 +1018,10 @@ def plot_metric(ref_data, test_data, fig, labels, location,
 
     # Determine by how much the test data overlaps with
     # the reference data.
-    ref_test = []
     ref_test_data = []
-    ref_test = [selection_overlap(segment, test_data)
-                for segment in ref_data]
+    ref_test = overlaps
+    if ref_test is None:
+        ref_test = _selection_overlaps(ref_data, test_data)
 
     # Overlap statistics
     #   - Number of segments selected
@@ -642,6 +1088,32 @@ def metric(sroi=None, output_dir=None, figtype=None):
 
     sitl_mp_data = filter_segments(sitl_data, '(MP|Magnetopause)')
 
+    # The pairwise overlap computations are independent of one
+    # another, so compute them in a thread pool before any plotting
+    # (matplotlib itself is not thread safe). The GLS-ABS MP pair
+    # depends on the ABS-SITL MP results and is computed afterwards.
+    pairs = [(gls_data, sitl_data), (sitl_data, gls_data),
+             (gls_data, sitl_mp_data), (sitl_mp_data, gls_data),
+             (abs_data, sitl_data), (sitl_data, abs_data),
+             (abs_data, sitl_mp_data), (sitl_mp_data, abs_data),
+             (gls_data, abs_data), (abs_data, gls_data)
+             ]
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        (o_gls_sitl, o_sitl_gls, o_gls_sitl_mp, o_sitl_mp_gls,
+         o_abs_sitl, o_sitl_abs, o_abs_sitl_mp, o_sitl_mp_abs,
+         o_gls_abs, o_abs_gls
+         ) = pool.map(lambda args: _selection_overlaps(*args), pairs)
+
+    abs_mp_data = [abs_data[idx]
+                   for idx, s in enumerate(o_abs_sitl_mp)
+                   if s['n_selections'] > 0]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        o_gls_abs_mp, o_abs_mp_gls = pool.map(
+            lambda args: _selection_overlaps(*args),
+            [(gls_data, abs_mp_data), (abs_mp_data, gls_data)]
+            )
+
     # Create a figure
     nbins = 10
     nrows = 4
@@ -652,48 +1124,44 @@ def metric(sroi=None, output_dir=None, figtype=None):
     # GLS-SITL Comparison
     ax, gls_sitl = plot_metric(gls_data, sitl_data, fig,
                                ('GLS', 'SITL'), (1, 1, nrows, ncols),
-                               nbins=nbins)
+                               nbins=nbins, overlaps=o_gls_sitl)
     ax, sitl_gls = plot_metric(sitl_data, gls_data, fig,
                                ('SITL', 'GLS'), (2, 1, nrows, ncols),
-                               nbins=nbins)
+                               nbins=nbins, overlaps=o_sitl_gls)
     ax, gls_sitl_mp = plot_metric(gls_data, sitl_mp_data, fig,
                                   ('GLS', 'SITL MP'), (3, 1, nrows, ncols),
-                                  nbins=nbins)
+                                  nbins=nbins, overlaps=o_gls_sitl_mp)
     ax, sitl_mp_gls = plot_metric(sitl_mp_data, gls_data, fig,
                                   ('SITL MP', 'GLS'), (4, 1, nrows, ncols),
-                                  nbins=nbins)
+                                  nbins=nbins, overlaps=o_sitl_mp_gls)
 
     # ABS-SITL Comparison
     ax, abs_sitl = plot_metric(abs_data, sitl_data, fig,
                                ('ABS', 'SITL'), (1, 2, nrows, ncols),
-                               nbins=nbins)
+                               nbins=nbins, overlaps=o_abs_sitl)
     ax, sitl_abs = plot_metric(sitl_data, abs_data, fig,
                                ('SITL', 'ABS'), (2, 2, nrows, ncols),
-                               nbins=nbins)
+                               nbins=nbins, overlaps=o_sitl_abs)
     ax, abs_sitl_mp = plot_metric(abs_data, sitl_mp_data, fig,
                                   ('ABS', 'SITL MP'), (3, 2, nrows, ncols),
-                                  nbins=nbins)
+                                  nbins=nbins, overlaps=o_abs_sitl_mp)
     ax, sitl_mp_abs = plot_metric(sitl_mp_data, abs_data, fig,
                                   ('SITL MP', 'ABS'), (4, 2, nrows, ncols),
-                                  nbins=nbins)
+                                  nbins=nbins, overlaps=o_sitl_mp_abs)
 
     # GLS-ABS Comparison
-    abs_mp_data = [abs_data[idx]
-                   for idx, s in enumerate(abs_sitl_mp)
-                   if s['n_selections'] > 0]
-
     ax, gls_abs = plot_metric(gls_data, abs_data, fig,
                               ('GLS', 'ABS'), (1, 3, nrows, ncols),
-                              nbins=nbins)
+                              nbins=nbins, overlaps=o_gls_abs)
     ax, abs_gls = plot_metric(abs_data, gls_data, fig,
                               ('ABS', 'GLS'), (2, 3, nrows, ncols),
-                              nbins=nbins)
+                              nbins=nbins, overlaps=o_abs_gls)
     ax, gls_abs_mp = plot_metric(gls_data, abs_mp_data, fig,
                                  ('GLS', 'ABS MP'), (3, 3, nrows, ncols),
-                                 nbins=nbins)
+                                 nbins=nbins, overlaps=o_gls_abs_mp)
     ax, abs_mp_gls = plot_metric(abs_mp_data, gls_data, fig,
                                  ('ABS MP', 'GLS'), (4, 3, nrows, ncols),
-                                 nbins=nbins)
+                                 nbins=nbins, overlaps=o_abs_mp_gls)
 
     # Save the figure
     if figtype is not None:
@@ -787,12 +1255,11 @@ def read_csv(filename, start_time=None, stop_time=None, header=True):
     '''
     # Convert time itnerval to datetimes if needed
     if isinstance(start_time, str):
-        start_time = dt.datetime.strptime(start_time, '%Y-%m-%d %H:%M:%S')
+        start_time = _parse_time_str(start_time)
     if isinstance(stop_time, str):
-        stop_time = dt.datetime.strptime(stop_time, '%Y-%m-%d %H:%M:%S')
+        stop_time = _parse_time_str(stop_time)
 
     file = pathlib.Path(filename)
-    data = []
 
     # Read the file
     with open(file.expanduser(), 'r', newline='') as csvfile:
@@ -802,28 +1269,29 @@ def read_csv(filename, start_time=None, stop_time=None, header=True):
         if header:
             keys = next(csvreader)
 
-        # Read the rows
-        for row in csvreader:
-            # Select the data within the time interval
-            if start_time is not None:
-                tstart = dt.datetime.strptime(row[0],
-                                              '%Y-%m-%d %H:%M:%S')
-                if tstart < start_time:
-                    continue
-            if stop_time is not None:
-                tstop = dt.datetime.strptime(row[1],
-                                             '%Y-%m-%d %H:%M:%S')
-                if tstop > stop_time:
-                    continue  # BREAK if sorted!!
-
-            # Initialize segment with required fields then add
-            # additional fields after
-            data.append(BurstSegment(row[0], row[1], float(row[2]), row[4],
-                                     sourceid=row[3], createtime=row[5]
-                                     )
-                        )
+        rows = list(csvreader)
 
-    return data
+    if len(rows) == 0:
+        return []
+
+    # Parse the time columns as blocks instead of row by row, then
+    # apply the time-interval filter as a single boolean mask
+    tstarts = np.array([row[0] for row in rows], dtype='datetime64[us]')
+    tstops = np.array([row[1] for row in rows], dtype='datetime64[us]')
+
+    keep = np.ones(len(rows), dtype=bool)
+    if start_time is not None:
+        keep &= tstarts >= np.datetime64(start_time, 'us')
+    if stop_time is not None:
+        keep &= tstops <= np.datetime64(stop_time, 'us')
+
+    # Initialize segments with required fields, passing the
+    # already-parsed datetimes
+    return [BurstSegment(tstarts[idx].item(), tstops[idx].item(),
+                         float(rows[idx][2]), rows[idx][4],
+                         sourceid=rows[idx][3], createtime=rows[idx][5]
+                         )
+            for idx in np.flatnonzero(keep)]
 
 
 def remove_duplicate_segments(data):
@@ -845,38 +1313,22 @@ def remove_duplicate_segments(data):
     results : list of `BurstSegments`
         Unique burst segments.
     '''
-    results = data.copy()
-    overwrite_times = set()
-    for idx, segment in enumerate(data):
-        iahead = idx + 1
-
-        # Segments should already be sorted. Future segments
-        # overlap with current segment if the future segement
-        # start time is closer to the current segment start
-        # time than is the current segment's end time.
-        while ((iahead < len(data)) and
-               ((data[iahead].tstart - segment.tstart) <
-                (segment.tstop - segment.tstart))
-               ):
-
-            # Remove the segment with the earlier create time
-            if segment.createtime < data[iahead].createtime:
-                remove_segment = segment
-                overwrite_time = segment.createtime
-            else:
-                remove_segment = data[iahead]
-                overwrite_time = data[iahead].createtime
-
-            # The segment may have already been removed if
-            # there are more than one other segments that
-            # overlap with it.
-            try:
-                results.remove(remove_segment)
-                overwrite_times.add(overwrite_time)
-            except ValueError:
-                pass
-
-            iahead += 1
+    if len(data) == 0:
+        return data.copy()
+
+    # Extract the segment bounds and create times as int64 arrays so
+    # that the overlap loop stays numeric (and JIT-compilable).
+    tai_start = np.fromiter((segment.taistarttime for segment in data),
+                            dtype=np.int64, count=len(data))
+    tai_stop = np.fromiter((segment.taiendtime for segment in data),
+                           dtype=np.int64, count=len(data))
+    createtime = np.array([segment.createtime for segment in data],
+                          dtype='datetime64[us]').astype(np.int64)
+
+    keep = _dedupe_keep_mask(tai_start, tai_stop, createtime)
+    results = [segment
+               for segment, keep_segment in zip(data, keep)
+               if keep_segment]
 
     # Remove all segments with create times in the overwrite set
     # Note that the model results do not appear to be reproducible
@@ -963,19 +1415,30 @@ def selection_overlap(ref, tests):
            }
 
     # Find which selections overlap with the given entry and by how much
-    tdelta = dt.timedelta(days=7000)
+    #   - Hoist the loop-invariant reference bounds and the running
+    #     totals out of the loop; attribute and dict lookups are paid
+    #     per iteration otherwise
+    ref_tstart = ref.tstart
+    ref_tstop = ref.tstop
+    n_selections = 0
+    t_overlap = out['t_overlap']
+    dt_next = out['dt_next']
     for test in tests:
+        test_tstart = test.tstart
+        test_tstop = test.tstop
 
-        if ((test.tstart <= ref.tstop) and
-            (test.tstop >= ref.tstart)
-            ):
-            out['n_selections'] += 1
-            out['t_overlap'] += (min(test.tstop, ref.tstop)
-                                 - max(test.tstart, ref.tstart)
-                                 )
+        if (test_tstart <= ref_tstop) and (test_tstop >= ref_tstart):
+            n_selections += 1
+            t_overlap += (min(test_tstop, ref_tstop)
+                          - max(test_tstart, ref_tstart)
+                          )
 
         # Time to nearest interval
-        out['dt_next'] = min(out['dt_next'], abs(test.tstart - ref.tstart))
+        dt_next = min(dt_next, abs(test_tstart - ref_tstart))
+
+    out['n_selections'] = n_selections
+    out['t_overlap'] = t_overlap
+    out['dt_next'] = dt_next
 
     # Overlap and over-selection statistics
     if out['n_selections'] > 0:
@@ -1042,7 +1505,7 @@ def sort_segments(data, createtime=False):
 
     Parameters
     ----------
-    data : list of `BurstSegement`
+    data : list of `BurstSegement` or `SegmentTable`
         Selections to be sorted. Must have keys 'start_time', 'end_time',
         'fom', 'discussion', 'tstart', and 'tstop'.
     createtime: bool
@@ -1050,12 +1513,18 @@ def sort_segments(data, createtime=False):
 
     Returns
     -------
-    results : list of `BurstSegement`
+    results : list of `BurstSegement` or `SegmentTable`
         Inputs sorted by time
     '''
+    # Tables sort with a C-level argsort on the key column.
+    # For lists, attrgetter avoids a Python lambda frame per comparison.
+    if isinstance(data, SegmentTable):
+        keys = data.createtime if createtime else data.tstart
+        return data[np.argsort(keys, kind='stable')]
+
     if createtime:
-        return sorted(data, key=lambda x: x.createtime)
-    return sorted(data, key=lambda x: x.tstart)
+        return sorted(data, key=attrgetter('createtime'))
+    return sorted(data, key=attrgetter('tstart'))
 
 
 def write_csv(filename, data, append=False):
@@ -1074,6 +1543,10 @@ def write_csv(filename, data, append=False):
     header = ('start_time', 'stop_time', 'fom', 'sourceid',
               'discussion', 'createtime')
 
+    # One attrgetter resolves every column of a row at once, and
+    # writerows lets the csv module batch the output
+    row_of = attrgetter(*header)
+
     mode = 'w'
     if append:
         mode = 'a'
@@ -1085,15 +1558,7 @@ def write_csv(filename, data, append=False):
         if not append:
             csvwriter.writerow(header)
 
-        for segment in data:
-            csvwriter.writerow([segment.start_time,
-                                segment.stop_time,
-                                segment.fom,
-                                segment.sourceid,
-                                segment.discussion,
-                                segment.createtime
-                                ]
-                               )
+        csvwriter.writerows(row_of(segment) for segment in data)
 
 
 if __name__ == 'main':